@@ -3,6 +3,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_URL: str
+    CREATE_TABLES_ON_STARTUP: bool = False
     model_config = SettingsConfigDict(env_file='.env')
 
 
@@ -1,32 +1,49 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import settings
 
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URL,
-    connect_args={'check_same_thread': False}
+database_url = make_url(settings.SQLALCHEMY_DATABASE_URL)
+is_sqlite = database_url.get_backend_name() == 'sqlite'
+if is_sqlite and database_url.get_driver_name() == 'pysqlite':
+    # Accept the sync URL shared with alembic.ini; the app needs the async driver.
+    database_url = database_url.set(drivername='sqlite+aiosqlite')
+
+engine = create_async_engine(
+    database_url,
+    connect_args={'check_same_thread': False} if is_sqlite else {},
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_recycle=3600,
+    pool_pre_ping=True
 )
 
-Sessionlocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
 
+if is_sqlite:
+    @event.listens_for(engine.sync_engine, 'connect')
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-64000')
+        cursor.close()
 
-class Expense(Base):
-    __tablename__ = 'Expense'
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    description = Column(String(50), nullable=False)
-    amount = Column(Float, nullable=False)
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+Base = declarative_base()
 
 
-def get_db():
-    db = Sessionlocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
-
-
-
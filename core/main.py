@@ -1,81 +1,109 @@
 from fastapi import FastAPI, status, Query, HTTPException, Path, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from typing import List
-from sqlalchemy.orm import Session
+import logging
+from typing import Annotated, List
+from sqlalchemy import select, insert, update, delete, lambda_stmt
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from schemas import ExpenseCreateSchema, ExpenseResponseSchema, ExpenseUpdateSchema
-from database import Base, engine, get_db, Expense
+from database import Base, engine, get_db
+from models import Expense
+from config import settings
 
+logger = logging.getLogger('uvicorn.error')
 
-app = FastAPI()
+# Shared by every 404 path; with_traceback(None) on each raise keeps the
+# traceback from growing across requests.
+COST_NOT_FOUND = HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                               detail='cost not found')
+
+ExpenseId = Annotated[int, Path(description='The ID of the cost in expenses')]
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print('Application startup')
-    Base.metadata.create_all(engine)
+    logger.info('Application startup')
+    # The schema is built by `alembic upgrade head`, run once before the workers
+    # start. create_all is only for throwaway databases that Alembic will not
+    # manage afterwards.
+    if settings.CREATE_TABLES_ON_STARTUP:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
     yield
-    print('Application shutdown')
+    await engine.dispose()
+    logger.info('Application shutdown')
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
-app = FastAPI(lifespan=lifespan)
 
+# Rows read back from the database are already typed by their columns, so
+# endpoints returning them skip response_model validation. Never use this on
+# user-submitted bodies; those must go through their Pydantic schemas.
+def serialize_expense(expense) -> dict:
+    return {'id': expense.id,
+            'description': expense.description,
+            # SQLite's RETURNING reports whole REAL values as integers
+            'amount': float(expense.amount)}
 
-@app.get('/expenses', status_code=status.HTTP_200_OK, response_model=List[ExpenseResponseSchema])
-def get_expenses(q: str | None = Query(
+
+@app.get('/expenses', status_code=status.HTTP_200_OK, response_model=None,
+         responses={status.HTTP_200_OK: {'model': List[ExpenseResponseSchema]}})
+async def get_expenses(q: str | None = Query(
         description='Search expenses by description',
         example='Internet',
         alias='search',
         max_length=50,
-        default=None), db: Session = Depends(get_db)):
-    query = db.query(Expense)
+        default=None), db: AsyncSession = Depends(get_db)):
+    query = lambda_stmt(lambda: select(Expense.id, Expense.description, Expense.amount))
     if q:
-        query = query.filter_by(description=q)
-    results = query.all()
-    return results
-
-
-@app.post('/expenses', status_code=status.HTTP_201_CREATED, response_model=ExpenseResponseSchema)
-def create_expense(request: ExpenseCreateSchema, db: Session = Depends(get_db)):
-    new_expense = Expense(description=request.description,
-                          amount=request.amount)
-    db.add(new_expense)
-    db.commit()
-    db.refresh(new_expense)
-    return new_expense
-
-
-@app.get('/expenses/{id}', status_code=status.HTTP_200_OK, response_model=ExpenseResponseSchema)
-def get_expense(id: int = Path(description='The ID of the cost in expenses'), db: Session = Depends(get_db)):
-    expense = db.query(Expense).filter_by(id=id).one_or_none()
-    if expense:
-        return expense
-    else:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
-                            detail='cost not found')
-
-
-@app.put('/expenses/{id}', status_code=status.HTTP_200_OK, response_model=ExpenseResponseSchema)
-def update_expense(request: ExpenseUpdateSchema, id: int = Path(description='The ID of the cost in expenses'), db: Session = Depends(get_db)):
-    expense = db.query(Expense).filter_by(id=id).one_or_none()
-    if expense:
-        expense.description = request.description
-        expense.amount = request.amount
-        db.commit()
-        db.refresh(expense)
-        return expense
-    else:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
-                            detail='cost not found')
-
-
-@app.delete('/expenses/{id}', status_code=status.HTTP_200_OK)
-def delete_expense(id: int = Path(description='The ID of the cost in expenses'), db: Session = Depends(get_db)):
-    expense = db.query(Expense).filter_by(id=id).one_or_none()
+        query += lambda s: s.where(Expense.description == q)
+    results = (await db.execute(query)).all()
+    return ORJSONResponse([serialize_expense(row) for row in results])
+
+
+@app.post('/expenses', status_code=status.HTTP_201_CREATED, response_model=None,
+          responses={status.HTTP_201_CREATED: {'model': ExpenseResponseSchema}})
+async def create_expense(request: ExpenseCreateSchema, db: AsyncSession = Depends(get_db)):
+    query = (insert(Expense)
+             .values(description=request.description, amount=request.amount)
+             .returning(Expense))
+    async with db.begin():
+        new_expense = (await db.execute(query)).scalar_one()
+    return ORJSONResponse(serialize_expense(new_expense),
+                          status_code=status.HTTP_201_CREATED)
+
+
+@app.get('/expenses/{id}', status_code=status.HTTP_200_OK, response_model=None,
+         responses={status.HTTP_200_OK: {'model': ExpenseResponseSchema}})
+async def get_expense(id: ExpenseId, db: AsyncSession = Depends(get_db)):
+    expense = await db.get(Expense, id)
     if expense:
-        db.delete(expense)
-        db.commit()
-        return JSONResponse(content={'detail': 'cost removed successfuly'},)
+        return ORJSONResponse(serialize_expense(expense))
     else:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
-                            detail='cost not found')
+        raise COST_NOT_FOUND.with_traceback(None)
+
+
+@app.put('/expenses/{id}', status_code=status.HTTP_200_OK, response_model=None,
+         responses={status.HTTP_200_OK: {'model': ExpenseResponseSchema}})
+async def update_expense(request: ExpenseUpdateSchema, id: ExpenseId, db: AsyncSession = Depends(get_db)):
+    query = (update(Expense)
+             .where(Expense.id == id)
+             .values(description=request.description, amount=request.amount)
+             .returning(Expense))
+    async with db.begin():
+        expense = (await db.execute(query)).scalar_one_or_none()
+        if expense:
+            return ORJSONResponse(serialize_expense(expense))
+        else:
+            raise COST_NOT_FOUND.with_traceback(None)
+
+
+@app.delete('/expenses/{id}', status_code=status.HTTP_200_OK, response_model=None)
+async def delete_expense(id: ExpenseId, db: AsyncSession = Depends(get_db)):
+    async with db.begin():
+        result = await db.execute(delete(Expense).where(Expense.id == id))
+        if result.rowcount:
+            return ORJSONResponse(content={'detail': 'cost removed successfuly'},)
+        else:
+            raise COST_NOT_FOUND.with_traceback(None)
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, Float
+
+from database import Base
+
+
+class Expense(Base):
+    __tablename__ = 'Expense'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    description = Column(String(50), nullable=False, index=True)
+    amount = Column(Float, nullable=False)
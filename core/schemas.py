@@ -1,9 +1,15 @@
+import re
+
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
+# Separators allowed between letters in a description.
+DESCRIPTION_SEPARATORS = re.compile(r'[\s-]+')
+
 
 class BaseExpenseSchema(BaseModel):
     description: str = Field(
         ...,
+        max_length=50,
         example="Internet purchase",
         description='Enter expense description (max 50 chars, alphabetic only)'
     )
@@ -16,9 +22,8 @@ class BaseExpenseSchema(BaseModel):
 
     @field_validator('description')
     def validate_name(cls, value):
-        if len(value) > 50:
-            raise ValueError('description most not exceed 50 characters')
-        if not all(char.isalpha() or char.isspace() or char == '-' for char in value):
+        letters = DESCRIPTION_SEPARATORS.sub('', value)
+        if letters and not letters.isalpha():
             raise ValueError(
                 'Description must contain only letters, spaces, or hyphens')
         return value